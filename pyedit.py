@@ -27,9 +27,22 @@ from __future__ import annotations # This must be the very first import
 
 import sys
 import os
+import re
+import math
+import copy
 import json
+import codecs
+import keyword
 import subprocess
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict, deque
+from functools import lru_cache, partial
+from typing import Optional, List, Dict, Set, Tuple, Any
+
+# orjson is an optional, faster drop-in for the session JSON; fall back to the stdlib.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Import necessary modules from PyQt6 for UI components and functionality.
@@ -42,13 +55,54 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import (
     QAction, QKeySequence, QFont, QTextCursor, QSyntaxHighlighter, QTextCharFormat, QColor,
-    QTextDocument, QPainter
+    QTextDocument, QPainter, QFontMetricsF
 )
 from PyQt6.QtCore import (
-    QSettings, QSize, Qt, QProcess, QObject, pyqtSignal, QFileInfo, QByteArray, QRect
+    QSettings, QSize, Qt, QProcess, QObject, pyqtSignal, QFileInfo, QByteArray, QRect, QEvent,
+    QFile, QTextStream, QTimer, QRunnable, QThreadPool, QRegularExpression
 )
 
 
+def _json_dumps(obj: Any) -> str:
+    """Serializes obj to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    # Same compact, unescaped-UTF-8 output as orjson: tab contents are mostly
+    # source text, and \uXXXX-escaping every non-ASCII character only costs time and space.
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Parses a JSON string or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=32)
+def _search_pattern(find_text: str, case_sensitive: bool, whole_word: bool) -> re.Pattern:
+    """Compiles (and caches) the regex used to find find_text with the given options."""
+    pattern = re.escape(find_text)
+    if whole_word:
+        pattern = r'\b' + pattern + r'\b'
+    return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def _search_qregex(find_text: str, case_sensitive: bool) -> QRegularExpression:
+    """
+    Compiles (and caches) the QRegularExpression used by Find Next and Replace.
+    The case option already matches the find flags, so QTextDocument.find reuses
+    the compiled pattern instead of rebuilding it on every search.
+    """
+    options = QRegularExpression.PatternOption.NoPatternOption
+    if not case_sensitive:
+        options |= QRegularExpression.PatternOption.CaseInsensitiveOption
+    regex = QRegularExpression(QRegularExpression.escape(find_text), options)
+    regex.optimize()
+    return regex
+
+
 # =========================================================================
 # Custom Widgets and Dialogs
 # =========================================================================
@@ -58,6 +112,10 @@ class LineNumberArea(QWidget):
     A custom widget to display line numbers for a QPlainTextEdit.
     The logic has been improved to ensure perfect alignment.
     """
+    # Colors are built once rather than on every paint.
+    BACKGROUND_COLOR = QColor("#2d2d30")
+    NUMBER_COLOR = QColor("#808080")
+
     def __init__(self, editor: QPlainTextEdit):
         super().__init__(editor)
         self.editor = editor
@@ -69,31 +127,37 @@ class LineNumberArea(QWidget):
     def paintEvent(self, event):
         """Paints the line numbers in the widget."""
         painter = QPainter(self)
-        painter.fillRect(event.rect(), QColor("#2d2d30"))
+        painter.fillRect(event.rect(), self.BACKGROUND_COLOR)
+        painter.setPen(self.NUMBER_COLOR)
 
         block = self.editor.firstVisibleBlock()
         block_number = block.blockNumber()
         
-        # This is the key change: use a robust method to get the block's position
+        # This is the key change: use a robust method to get the block's position.
+        # It also accounts for the first line being partially visible.
         top = int(self.editor.blockBoundingGeometry(block).translated(self.editor.contentOffset()).top())
-        bottom = top + int(self.editor.blockBoundingRect(block).height())
-        
-        # A simple check for the first line being outside the viewport
-        offset = self.editor.contentOffset().y()
-        if block.isVisible():
-            # Adjust the top position to account for the first line being partially visible.
-            top = int(self.editor.blockBoundingGeometry(block).translated(self.editor.contentOffset()).top())
+
+        # Only blocks intersecting the dirty rect need to be drawn.
+        line_h = self.editor._line_h
+        # Without wrapping every block is exactly one line tall, so the height
+        # doesn't have to be asked from the layout for each block.
+        fixed_height = self.editor.lineWrapMode() == QPlainTextEdit.LineWrapMode.NoWrap
+        width = self.width()
+        ev_top = event.rect().top()
+        ev_bot = event.rect().bottom()
 
         # Iterate over all visible blocks
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible():
+        while block.isValid() and top <= ev_bot:
+            if block.isVisible() and top + line_h >= ev_top:
                 number = str(block_number + 1)
-                painter.setPen(QColor("#808080"))
-                painter.drawText(0, top, self.width(), self.editor.fontMetrics().height(),
+                painter.drawText(0, top, width, line_h,
                                  Qt.AlignmentFlag.AlignRight, number)
             
             block = block.next()
-            top = top + int(self.editor.blockBoundingRect(block).height())
+            if fixed_height:
+                top += line_h
+            else:
+                top += int(self.editor.blockBoundingRect(block).height())
             block_number += 1
 
 
@@ -113,11 +177,19 @@ class PyEdit(QPlainTextEdit):
         # This fixes the hardcoded tab stop issue.
         tab_width_space = self.fontMetrics().horizontalAdvance(' ') * 4
         self.setTabStopDistance(tab_width_space)
+
+        # Font metrics used by the line number area are cached and only
+        # refreshed when the font changes.
+        self._refreshFontCache()
         
         # Connect the document's modification state to our custom signal
         self.document().modificationChanged.connect(self.modification_state_changed)
         
         self.file_path: Optional[str] = None
+        # Whether this editor's tab title currently carries the unsaved-changes asterisk
+        self.tab_has_asterisk = False
+        # Set while a restored tab's text is still being read back from disk
+        self.awaiting_text = False
         
         # **FIX:** Ensure the highlighter is a class attribute so it's not garbage collected.
         self.highlighter = PythonHighlighter(self.document())
@@ -127,6 +199,13 @@ class PyEdit(QPlainTextEdit):
         self.blockCountChanged.connect(self.updateLineNumberAreaWidth)
         self.updateRequest.connect(self.updateLineNumberArea)
         self.cursorPositionChanged.connect(self.highlightCurrentLine)
+
+        # In-place gutter repaints are accumulated and flushed once per event loop pass.
+        self._pending_rect = QRect()
+        self._lna_timer = QTimer(self)
+        self._lna_timer.setSingleShot(True)
+        self._lna_timer.setInterval(0)
+        self._lna_timer.timeout.connect(self._flushLineNumberArea)
         
         self.updateLineNumberAreaWidth(0)
 
@@ -135,21 +214,69 @@ class PyEdit(QPlainTextEdit):
         self.highlight_format.setBackground(QColor("#404040"))
         self.current_highlighting = False
 
+        # A single ExtraSelection is reused for every cursor move; only its cursor changes.
+        self._current_line_sel = QTextEdit.ExtraSelection()
+        self._current_line_sel.format = self.highlight_format
+
+    @property
+    def file_path(self) -> Optional[str]:
+        """Path of the file shown in this editor, or None for an untitled tab."""
+        return self._file_path
+
+    @file_path.setter
+    def file_path(self, file_path: Optional[str]):
+        # The tab title and status bar file type are derived once per path change.
+        self._file_path = file_path
+        if file_path:
+            self.file_name = os.path.basename(file_path)
+            file_extension = QFileInfo(file_path).suffix().lower()
+            self.filetype_label = "Python" if file_extension == 'py' else f".{file_extension}"
+        else:
+            self.file_name = None
+            self.filetype_label = "Plain Text"
+
+    def load_text(self, text: str):
+        """
+        Replaces the editor's content with text, e.g. a freshly opened file.
+        The highlighter is detached while the text is set, then catches up in batches.
+        """
+        self.detach_highlighter()
+        self.setPlainText(text)
+        self.attach_highlighter()
+
+    def detach_highlighter(self):
+        """Detaches the highlighter, so bulk edits don't rehighlight every block they touch."""
+        self.highlighter.setDocument(None)
+
+    def attach_highlighter(self):
+        """Reattaches the highlighter; the document is then highlighted in batches."""
+        if self.highlighter.document() is None:
+            self.highlighter.setDocumentInBatches(self.document())
+
     def resizeEvent(self, event):
         """Overrides the resize event to correctly position the line number area."""
         super().resizeEvent(event)
         cr = self.contentsRect()
         self.lineNumberArea.setGeometry(QRect(cr.left(), cr.top(), self.lineNumberAreaWidth(), cr.height()))
 
+    def changeEvent(self, event):
+        """Refreshes the cached font metrics whenever the widget's font changes."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._refreshFontCache()
+            self.updateLineNumberAreaWidth(0)
+
+    def _refreshFontCache(self):
+        """Caches the digit width and line height of the current font."""
+        metrics = self.fontMetrics()
+        self._digit_width = metrics.horizontalAdvance('9')
+        # The text layout rounds each line's fractional height up, which the
+        # integer metrics.height() doesn't always match.
+        self._line_h = math.ceil(QFontMetricsF(self.font()).height())
+
     def lineNumberAreaWidth(self) -> int:
         """Calculates the required width for the line number area."""
-        digits = 1
-        max_val = max(1, self.blockCount())
-        while max_val >= 10:
-            max_val /= 10
-            digits += 1
-        space = 3 + self.fontMetrics().horizontalAdvance('9') * digits
-        return space
+        return 3 + self._digit_width * len(str(max(1, self.blockCount())))
 
     def updateLineNumberAreaWidth(self, newBlockCount: int):
         """Updates the line number area's width based on the number of lines."""
@@ -160,24 +287,29 @@ class PyEdit(QPlainTextEdit):
         if dy:
             self.lineNumberArea.scroll(0, dy)
         else:
-            self.lineNumberArea.update(0, rect.y(), self.lineNumberArea.width(), rect.height())
+            self._pending_rect = self._pending_rect.united(rect)
+            if not self._lna_timer.isActive():
+                self._lna_timer.start()
         
         if rect.contains(self.viewport().rect()):
             self.updateLineNumberAreaWidth(0)
 
+    def _flushLineNumberArea(self):
+        """Repaints the union of all gutter rects requested since the last flush."""
+        rect = self._pending_rect
+        self._pending_rect = QRect()
+        self.lineNumberArea.update(0, rect.y(), self.lineNumberArea.width(), rect.height())
+
     def highlightCurrentLine(self):
         """Highlights the line where the cursor is located."""
         if not self.isReadOnly():
-            selection = []
             cursor = self.textCursor()
             # Only highlight if there is no selection
-            if not cursor.hasSelection():
-                line_selection = QTextEdit.ExtraSelection()
-                line_selection.format = self.highlight_format
-                line_selection.cursor = cursor
-                line_selection.cursor.clearSelection()
-                selection.append(line_selection)
-            self.setExtraSelections(selection)
+            if cursor.hasSelection():
+                self.setExtraSelections([])
+            else:
+                self._current_line_sel.cursor = cursor
+                self.setExtraSelections([self._current_line_sel])
 
 
 class InteractiveConsole(QPlainTextEdit):
@@ -186,23 +318,40 @@ class InteractiveConsole(QPlainTextEdit):
     It captures user input and sends it to the controller.
     """
     command_entered = pyqtSignal(str)
+
+    # Caps on remembered commands and on the lines kept in the console.
+    MAX_HISTORY = 1000
+    MAX_LINES = 10_000
     
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.setReadOnly(True)
+        # Old lines are dropped from the top once the limit is reached.
+        self.setMaximumBlockCount(self.MAX_LINES)
+
+        # Marks where the current input starts. A QTextCursor is used rather than
+        # a plain int so the position follows the text when old lines are dropped.
+        self._input_start = QTextCursor(self.document())
+        self._input_start.setKeepPositionOnInsert(True)
+
         self.prompt = ">>> "
         self.setPrompt(self.prompt)
         
-        self.history = []
+        self.history: deque[str] = deque(maxlen=self.MAX_HISTORY)
         self.history_index = -1
 
+    @property
+    def current_line_start_pos(self) -> int:
+        """Document position right after the current prompt."""
+        return self._input_start.position()
+
     def setPrompt(self, new_prompt: str):
         self.prompt = new_prompt
-        self.current_line_start_pos = self.textCursor().position() + len(self.prompt)
         self.appendPlainText(self.prompt)
         # FIX: Changed `QTextCursor.End` to `QTextCursor.MoveOperation.End`
         self.moveCursor(QTextCursor.MoveOperation.End)
+        self._input_start.setPosition(self.textCursor().position())
 
     def keyPressEvent(self, event):
         """Captures user input and handles special keys."""
@@ -235,32 +384,24 @@ class InteractiveConsole(QPlainTextEdit):
             else:
                 self.history_index = -1 # Clear the line if at the beginning of history
 
-        # Erase current input and replace with history command
-        self.textCursor().beginEditBlock()
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.StartOfLine)
-        cursor.movePosition(QTextCursor.MoveOperation.EndOfLine, QTextCursor.MoveMode.KeepAnchor)
+        # Erase current input (everything after the prompt) and replace with history command
+        cursor = self._select_input()
+        cursor.beginEditBlock()
         cursor.removeSelectedText()
-        cursor.insertText(self.prompt)
-        
         if self.history_index != -1:
-            self.insertPlainText(self.history[self.history_index])
-
-        self.textCursor().endEditBlock()
+            cursor.insertText(self.history[self.history_index])
+        cursor.endEditBlock()
+        self.setTextCursor(cursor)
         
     def _handle_command_entry(self):
         """Processes the command entered by the user."""
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.StartOfLine)
-        cursor.movePosition(QTextCursor.MoveOperation.EndOfLine, QTextCursor.MoveMode.KeepAnchor)
-        
-        # Get the command, trim the prompt, and remove leading/trailing whitespace
-        command = cursor.selectedText().strip()[len(self.prompt):].strip()
+        # Get the command and remove leading/trailing whitespace
+        command = self._select_input().selectedText().strip()
         
         # Add the command to history if it's not empty
         if command:
             if not self.history or self.history[0] != command:
-                self.history.insert(0, command)
+                self.history.appendleft(command)
         
         # Reset history index
         self.history_index = -1
@@ -270,12 +411,22 @@ class InteractiveConsole(QPlainTextEdit):
         self.command_entered.emit(command)
         self.setPrompt(self.prompt)
 
+    def _select_input(self) -> QTextCursor:
+        """Returns a cursor selecting the user's input after the current prompt."""
+        cursor = self.textCursor()
+        cursor.setPosition(self.current_line_start_pos)
+        cursor.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+        return cursor
+
     def appendPlainText(self, text: str):
         """Adds text to the console without a prompt."""
         cursor = self.textCursor()
         # FIX: Changed `QTextCursor.End` to `QTextCursor.MoveOperation.End`
         cursor.movePosition(QTextCursor.MoveOperation.End)
         cursor.insertText(text)
+        # Input starts after the latest output, so output that lands after the
+        # prompt never becomes part of the command or gets erased by history.
+        self._input_start.setPosition(cursor.position())
         self.setTextCursor(cursor)
         self.ensureCursorVisible()
 
@@ -351,12 +502,43 @@ class PythonHighlighter(QSyntaxHighlighter):
     A more comprehensive syntax highlighter for Python code.
     Includes highlighting for keywords, built-ins, strings, comments, numbers,
     classes, methods, and self.
+    Each line is scanned once, left to right, and every token is formatted by its type.
     """
+    # Maximum number of distinct block texts whose formatting is remembered.
+    CACHE_SIZE = 4096
+    # Blocks highlighted per event loop pass after a bulk load.
+    BATCH_SIZE = 100
+
+    # Single-pass tokenizer: the first alternative that matches at a position wins,
+    # so comments and strings swallow any keywords or quotes inside them, and a
+    # "def"/"class" header is taken before the generic name rule.
+    TOKEN_RE = re.compile(
+        r'(?P<comment>#.*)'
+        r'|(?P<string>"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')'
+        r'|(?P<number>\b[0-9]+(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?\b)'
+        r'|\b(?P<defkw>class|def)\s+(?P<defname>[A-Za-z_][A-Za-z0-9_]*)\b'
+        r'|(?P<name>\b[A-Za-z_][A-Za-z0-9_]*\b)'
+    )
+    # Group numbers, so the scan loop compares match.lastindex ints instead of names.
+    NAME_GROUP = TOKEN_RE.groupindex["name"]
+    DEFNAME_GROUP = TOKEN_RE.groupindex["defname"]
+
     def __init__(self, parent: QTextDocument):
         super().__init__(parent)
 
-        self.highlighting_rules = []
-        
+        # LRU cache of block text -> [(start, length, format), ...]. Highlighting
+        # depends only on the line's text, so unchanged lines can be replayed.
+        self._cache: OrderedDict[str, list] = OrderedDict()
+
+        # After a bulk load, blocks from this position on are left plain until the
+        # batch timer reaches them. A cursor rather than a block number, so the
+        # frontier follows lines inserted or deleted above it while batching runs.
+        # None means every block is highlighted normally.
+        self._frontier: Optional[QTextCursor] = None
+        self._batch_timer = QTimer(self)
+        self._batch_timer.setInterval(0)
+        self._batch_timer.timeout.connect(self._highlight_next_batch)
+
         # Define formats
         keyword_format = QTextCharFormat()
         keyword_format.setForeground(QColor("#569cd6"))
@@ -383,15 +565,18 @@ class PythonHighlighter(QSyntaxHighlighter):
         self_format.setForeground(QColor("#569cd6"))
         self_format.setFontItalic(True)
 
-        # Highlighting rules
-        keywords = ["and", "as", "assert", "async", "await", "break", "class", "continue",
-                    "def", "del", "elif", "else", "except", "False", "finally", "for",
-                    "from", "global", "if", "import", "in", "is", "lambda", "None",
-                    "nonlocal", "not", "or", "pass", "raise", "return", "True",
-                    "try", "while", "with", "yield"]
-        for word in keywords:
-            self.highlighting_rules.append((r'\b' + word + r'\b', keyword_format))
+        # Token type -> format for everything except names and def/class headers.
+        self.token_formats = {
+            "comment": comment_format,
+            "string": string_format,
+            "number": number_format,
+        }
+        # The same table as a list indexed by group number, for the scan loop.
+        self._group_formats: List[Optional[QTextCharFormat]] = [None] * (self.TOKEN_RE.groups + 1)
+        for group, format in self.token_formats.items():
+            self._group_formats[self.TOKEN_RE.groupindex[group]] = format
 
+        # Names are classified with a single dict lookup.
         functions = ["abs", "all", "any", "ascii", "bin", "bool", "bytearray", "bytes", "callable",
                      "chr", "classmethod", "compile", "complex", "delattr", "dict", "dir", "divmod",
                      "enumerate", "eval", "exec", "filter", "float", "format", "frozenset", "getattr",
@@ -400,25 +585,82 @@ class PythonHighlighter(QSyntaxHighlighter):
                      "min", "next", "object", "oct", "open", "ord", "pow", "print", "property",
                      "range", "repr", "reversed", "round", "set", "setattr", "slice", "sorted",
                      "staticmethod", "str", "sum", "super", "tuple", "type", "vars", "zip"]
-        for word in functions:
-            self.highlighting_rules.append((r'\b' + word + r'\b', function_format))
+        self.name_formats = dict.fromkeys(functions, function_format)
+        self.name_formats.update(dict.fromkeys(keyword.kwlist, keyword_format))
+        self.name_formats["self"] = self_format
+
+        # Format for the name in a "class X" / "def x" header, keyed by the keyword.
+        self.keyword_format = keyword_format
+        self.definition_formats = {"class": class_format, "def": method_format}
 
-        self.highlighting_rules.append((r'".*?"', string_format))
-        self.highlighting_rules.append((r"'.*?'", string_format))
-        self.highlighting_rules.append((r'#.*', comment_format))
-        self.highlighting_rules.append((r'\b[0-9]+(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?\b', number_format))
-        self.highlighting_rules.append((r'\bclass\s+([A-Za-z0-9_]+)\b', class_format))
-        self.highlighting_rules.append((r'\bdef\s+([A-Za-z0-9_]+)\b', method_format))
-        self.highlighting_rules.append((r'\bself\b', self_format))
+    def setDocumentInBatches(self, document: QTextDocument):
+        """
+        Attaches to document and highlights it a batch of blocks at a time,
+        starting from the top, so the first screenful is painted right away.
+        """
+        self._frontier = QTextCursor(document)
+        self.setDocument(document)
+        self._batch_timer.start()
+
+    def _highlight_next_batch(self):
+        """Highlights the next BATCH_SIZE blocks of a bulk-loaded document."""
+        document = self.document()
+        if document is None or self._frontier is None or self._frontier.document() is not document:
+            self._batch_timer.stop()
+            self._frontier = None
+            return
+        block = document.findBlock(self._frontier.position())
+        for _ in range(self.BATCH_SIZE):
+            # The frontier is moved past the block first, so highlightBlock doesn't skip it.
+            next_block = block.next()
+            if next_block.isValid():
+                self._frontier.setPosition(next_block.position())
+            else:
+                self._frontier = None
+            self.rehighlightBlock(block)
+            if self._frontier is None:
+                self._batch_timer.stop()
+                return
+            block = next_block
 
     def highlightBlock(self, text: str):
         """Applies highlighting rules to the given text block."""
-        import re
-        for pattern, format in self.highlighting_rules:
-            for match in re.finditer(pattern, text):
+        if self._frontier is not None and self.currentBlock().position() >= self._frontier.position():
+            return
+
+        spans = self._cache.get(text)
+        if spans is not None:
+            self._cache.move_to_end(text)
+        else:
+            spans = self._tokenize(text)
+            self._cache[text] = spans
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        for start, length, format in spans:
+            self.setFormat(start, length, format)
+
+    def _tokenize(self, text: str) -> list:
+        """Scans text once and returns (start, length, format) for each highlighted token."""
+        spans = []
+        for match in self.TOKEN_RE.finditer(text):
+            kind = match.lastindex
+            if kind == self.NAME_GROUP:
+                format = self.name_formats.get(match.group())
+                if format is None:
+                    continue
+            elif kind == self.DEFNAME_GROUP:
                 start = match.start()
-                length = match.end() - start
-                self.setFormat(start, length, format)
+                spans.append((start, match.end("defkw") - start, self.keyword_format))
+                start = match.start("defname")
+                spans.append((start, match.end() - start, self.definition_formats[match.group("defkw")]))
+                continue
+            else:
+                format = self._group_formats[kind]
+
+            start = match.start()
+            spans.append((start, match.end() - start, format))
+        return spans
 
 
 # =========================================================================
@@ -430,37 +672,75 @@ class SettingsManager(QObject):
     Handles the loading and saving of application settings.
     Uses QSettings for platform-independent persistence.
     """
+    # Saved tabs are stored as parallel "paths"/"contents"/"dirty" lists.
+    # Schema 1 was a list of {"path", "content", "is_dirty"} dicts.
+    TABS_SCHEMA = 2
+
     def __init__(self, parent: QObject = None):
         super().__init__(parent)
         self.settings = QSettings("PyEdit", "PythonFocusedEditor")
+        # Last loaded/saved values, so repeated loads don't go back to QSettings.
+        # Kept as private copies: callers get their own lists and can modify them freely.
+        self._cached: Optional[Dict[str, Any]] = None
 
     def load_settings(self) -> Dict[str, Any]:
         """Loads settings from disk and returns them as a dictionary."""
-        settings_data = {
-            "font_size": int(self.settings.value("font_size", 12)),
-            "recent_files": self._load_json_list("recent_files"),
-            "dark_mode": self.settings.value("dark_mode", False, type=bool),
-            "tabs": self._load_json_list("tabs")
-        }
-        return settings_data
-
-    def save_settings(self, font_size: int, recent_files: list, dark_mode: bool, tabs: list):
-        """Saves settings to disk."""
+        if self._cached is None:
+            self._cached = {
+                "font_size": int(self.settings.value("font_size", 12)),
+                "recent_files": self._load_json_list("recent_files"),
+                "dark_mode": self.settings.value("dark_mode", False, type=bool),
+                "tabs": self._load_tabs()
+            }
+        return copy.deepcopy(self._cached)
+
+    def save_settings(self, font_size: int, recent_files: list, dark_mode: bool, tabs: Dict[str, list]):
+        """Saves settings to disk. `tabs` holds the parallel "paths", "contents" and "dirty" lists."""
         self.settings.setValue("font_size", font_size)
-        self.settings.setValue("recent_files", json.dumps(recent_files))
+        self.settings.setValue("recent_files", _json_dumps(recent_files))
         self.settings.setValue("dark_mode", dark_mode)
-        self.settings.setValue("tabs", json.dumps(tabs))
+        self.settings.setValue("tabs", _json_dumps({"schema": self.TABS_SCHEMA, **tabs}))
+
+        if self._cached is not None:
+            self._cached.update(font_size=font_size, recent_files=list(recent_files),
+                                dark_mode=dark_mode, tabs=copy.deepcopy(tabs))
+
+    def flush(self):
+        """Writes any pending settings to permanent storage."""
         self.settings.sync()
 
-    def _load_json_list(self, key: str) -> List[Any]:
-        """Helper to load and parse a JSON-encoded list from QSettings."""
-        data = self.settings.value(key, b"[]")
+    def _load_json(self, key: str) -> Any:
+        """Helper to load and parse a JSON value from QSettings. Returns None if missing or invalid."""
+        data = self.settings.value(key, None)
         if isinstance(data, QByteArray):
+            data = bytes(data)
+        if isinstance(data, (str, bytes)):
             try:
-                return json.loads(bytes(data).decode())
-            except json.JSONDecodeError:
-                return []
-        return []
+                return _json_loads(data)
+            except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
+                return None
+        return None
+
+    def _load_json_list(self, key: str) -> List[Any]:
+        """Helper to load and parse a JSON-encoded list from QSettings."""
+        value = self._load_json(key)
+        return value if isinstance(value, list) else []
+
+    def _load_tabs(self) -> Dict[str, list]:
+        """Loads the saved tabs as parallel "paths", "contents" and "dirty" lists."""
+        data = self._load_json("tabs")
+        if isinstance(data, list):
+            # Schema 1: one dict per tab. Converted here; the next save writes schema 2.
+            tabs = [tab for tab in data if isinstance(tab, dict)]
+            return {
+                "paths": [tab.get("path") for tab in tabs],
+                "contents": [tab.get("content", "") for tab in tabs],
+                "dirty": [tab.get("is_dirty", False) for tab in tabs]
+            }
+        if isinstance(data, dict) and data.get("schema") == self.TABS_SCHEMA:
+            return {key: data.get(key) if isinstance(data.get(key), list) else []
+                    for key in ("paths", "contents", "dirty")}
+        return {"paths": [], "contents": [], "dirty": []}
 
 
 class FileManager(QObject):
@@ -471,7 +751,7 @@ class FileManager(QObject):
     # Signals for communicating with the controller/UI
     file_opened_signal = pyqtSignal(str, str, str)  # filePath, content, title
     file_saved_signal = pyqtSignal(str)              # filePath
-    file_saved_as_signal = pyqtSignal(str, str)      # filePath, title
+    file_saved_as_signal = pyqtSignal(object, str, str)  # editor, filePath, title
     status_message_signal = pyqtSignal(str)
 
     def __init__(self, parent: QObject = None):
@@ -485,22 +765,52 @@ class FileManager(QObject):
         
         if file_path:
             try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    title = os.path.basename(file_path)
-                    self.file_opened_signal.emit(file_path, content, title)
-                    self.status_message_signal.emit(f"Opened: {file_path}")
+                content = self._read_text(file_path)
+                title = os.path.basename(file_path)
+                self.file_opened_signal.emit(file_path, content, title)
+                self.status_message_signal.emit(f"Opened: {file_path}")
             except Exception as e:
                 QMessageBox.critical(None, "Error", f"Could not open file: {e}")
 
+    @staticmethod
+    def _read_text(file_path: str) -> str:
+        """
+        Reads a file as UTF-8 text through QFile/QTextStream.
+        The buffer stays on the Qt side until the final QString is handed back.
+        """
+        f = QFile(file_path)
+        if not f.open(QFile.OpenModeFlag.ReadOnly | QFile.OpenModeFlag.Text):
+            raise OSError(f.errorString())
+        try:
+            return QTextStream(f).readAll()
+        finally:
+            f.close()
+
+    def _write_text(self, file_path: str, text: str):
+        """Writes text to a file as UTF-8 through QFile/QTextStream."""
+        f = QFile(file_path)
+        if not f.open(QFile.OpenModeFlag.WriteOnly | QFile.OpenModeFlag.Truncate | QFile.OpenModeFlag.Text):
+            raise OSError(f.errorString())
+        try:
+            stream = QTextStream(f)
+            stream << text
+            stream.flush()
+            if stream.status() != QTextStream.Status.Ok:
+                raise OSError(f.errorString())
+        finally:
+            f.close()
+
     def save_file(self, editor: PyEdit) -> bool:
         """Saves content to an existing file path and returns True on success."""
+        if editor.awaiting_text:
+            # The buffer is still empty; saving it would wipe the file on disk.
+            self.status_message_signal.emit(f"Still loading: {editor.file_path}")
+            return False
         if not editor.file_path:
             return self.save_file_as(editor)
         
         try:
-            with open(editor.file_path, 'w') as f:
-                f.write(editor.toPlainText())
+            self._write_text(editor.file_path, editor.toPlainText())
             editor.document().setModified(False)
             self.file_saved_signal.emit(editor.file_path)
             self.status_message_signal.emit(f"Saved: {editor.file_path}")
@@ -511,16 +821,18 @@ class FileManager(QObject):
 
     def save_file_as(self, editor: PyEdit) -> bool:
         """Prompts for a new file path and saves the content, returning True on success."""
+        if editor.awaiting_text:
+            self.status_message_signal.emit(f"Still loading: {editor.file_path}")
+            return False
         file_path, _ = QFileDialog.getSaveFileName(
             None, "Save File As", "", "All Files (*);;Python Files (*.py)")
         
         if file_path:
             try:
-                with open(file_path, 'w') as f:
-                    f.write(editor.toPlainText())
+                self._write_text(file_path, editor.toPlainText())
                 editor.document().setModified(False)
                 title = os.path.basename(file_path)
-                self.file_saved_as_signal.emit(file_path, title)
+                self.file_saved_as_signal.emit(editor, file_path, title)
                 self.status_message_signal.emit(f"Saved: {file_path}")
                 return True
             except Exception as e:
@@ -529,6 +841,56 @@ class FileManager(QObject):
         return False
 
 
+class _DecodeTask(QRunnable):
+    """
+    Decodes one chunk of process output on a worker thread.
+    The text is posted back through a signal connected with a queued connection.
+    """
+    def __init__(self, data: bytes, decoder: codecs.IncrementalDecoder, signal, final: bool = False):
+        super().__init__()
+        self.data = data
+        self.decoder = decoder
+        self.signal = signal
+        self.final = final
+
+    def run(self):
+        text = self.decoder.decode(self.data, self.final)
+        if text:
+            self.signal.emit(text)
+
+
+def _stat_paths(paths: List[str], read_paths: Set[str]) -> Dict[str, Tuple[bool, Optional[str]]]:
+    """
+    Returns {path: (exists, text)} for the given paths.
+    The text is only read for paths in read_paths; a file that can't be read counts as missing.
+    """
+    result = {}
+    for path in paths:
+        if path in read_paths:
+            try:
+                result[path] = (True, FileManager._read_text(path))
+            except OSError:
+                result[path] = (False, None)
+        else:
+            result[path] = (os.path.exists(path), None)
+    return result
+
+
+class _StatTask(QRunnable):
+    """
+    Checks which of a list of paths exist on a worker thread, reading the ones in read_paths.
+    The {path: (exists, text)} mapping is posted back through a queued signal.
+    """
+    def __init__(self, paths: List[str], read_paths: Set[str], signal):
+        super().__init__()
+        self.paths = paths
+        self.read_paths = read_paths
+        self.signal = signal
+
+    def run(self):
+        self.signal.emit(_stat_paths(self.paths, self.read_paths))
+
+
 class ScriptRunner(QObject):
     """
     Handles running and stopping external processes (e.g., Python scripts).
@@ -539,22 +901,68 @@ class ScriptRunner(QObject):
     error_signal = pyqtSignal(str)
     finished_signal = pyqtSignal(int)
 
+    # Internal signals emitted from the decode thread, delivered on the UI thread
+    _stdout_decoded = pyqtSignal(str)
+    _stderr_decoded = pyqtSignal(str)
+    _process_finished = pyqtSignal(int)
+
+    # Large reads are emitted in pieces of at most this many characters so the
+    # console can paint between them.
+    OUTPUT_CHUNK_SIZE = 64 * 1024
+
     def __init__(self, parent: QObject = None):
         super().__init__(parent)
         self.process = QProcess(self)
         self.process.readyReadStandardOutput.connect(self._read_stdout)
         self.process.readyReadStandardError.connect(self._read_stderr)
-        self.process.finished.connect(self.finished_signal.emit)
+        self.process.finished.connect(self._on_process_finished)
+
+        # Output is decoded off the UI thread. A single worker keeps the chunks,
+        # and the final finished notification, in the order they were read.
+        self._decode_pool = QThreadPool(self)
+        self._decode_pool.setMaxThreadCount(1)
+        queued = Qt.ConnectionType.QueuedConnection
+        self._stdout_decoded.connect(self._on_stdout_decoded, queued)
+        self._stderr_decoded.connect(self._on_stderr_decoded, queued)
+        self._process_finished.connect(self.finished_signal, queued)
+
+        # Incremental decoders keep multi-byte characters intact across reads.
+        self._new_decoders()
+
+    def _new_decoders(self):
+        """Creates fresh stdout/stderr decoders; pending tasks keep the old ones."""
+        self._stdout_decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self._stderr_decoder = codecs.getincrementaldecoder("utf-8")("replace")
 
     def _read_stdout(self):
-        """Reads standard output and emits a signal."""
-        data = self.process.readAllStandardOutput().data().decode()
-        self.output_signal.emit(data)
+        """Reads standard output and queues it for decoding."""
+        raw = bytes(self.process.readAllStandardOutput())
+        self._decode_pool.start(_DecodeTask(raw, self._stdout_decoder, self._stdout_decoded))
 
     def _read_stderr(self):
-        """Reads standard error and emits a signal."""
-        data = self.process.readAllStandardError().data().decode()
-        self.error_signal.emit(data)
+        """Reads standard error and queues it for decoding."""
+        raw = bytes(self.process.readAllStandardError())
+        self._decode_pool.start(_DecodeTask(raw, self._stderr_decoder, self._stderr_decoded))
+
+    def _on_process_finished(self, exit_code: int):
+        """Flushes the decoders and reports the exit code after any pending output."""
+        self._decode_pool.start(_DecodeTask(b"", self._stdout_decoder, self._stdout_decoded, final=True))
+        self._decode_pool.start(_DecodeTask(b"", self._stderr_decoder, self._stderr_decoded, final=True))
+        self._decode_pool.start(lambda: self._process_finished.emit(exit_code))
+
+    def _on_stdout_decoded(self, text: str):
+        """Forwards decoded standard output on the UI thread."""
+        self._emit_chunked(self.output_signal, text)
+
+    def _on_stderr_decoded(self, text: str):
+        """Forwards decoded standard error on the UI thread."""
+        self._emit_chunked(self.error_signal, text)
+
+    def _emit_chunked(self, signal, text: str):
+        """Emits text on the given signal, split into bounded chunks."""
+        step = self.OUTPUT_CHUNK_SIZE
+        for start in range(0, len(text), step):
+            signal.emit(text[start:start + step])
 
     def write_to_stdin(self, command: str):
         """Writes a command to the process's standard input."""
@@ -574,6 +982,7 @@ class ScriptRunner(QObject):
         if args:
             command.extend(args)
         
+        self._new_decoders()
         self.output_signal.emit(f"\n[Running script: {' '.join(command)}]\n")
         self.process.start(command[0], command[1:])
         
@@ -606,6 +1015,11 @@ class PythonFocusedEditorUI(QMainWindow):
 
     def _create_widgets(self):
         """Creates the main widgets for the application."""
+        # One font shared by the console and every editor; set_font_size resizes it.
+        self._editor_font = QFont("Consolas", 12)
+        # The unsaved-changes prompt is built on first use and then reused.
+        self._close_box: Optional[QMessageBox] = None
+
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         
@@ -622,6 +1036,7 @@ class PythonFocusedEditorUI(QMainWindow):
         self.console_frame_layout.setContentsMargins(0, 0, 0, 0)
         
         self.console = InteractiveConsole()
+        self.console.setFont(self._editor_font)
         self.console.setMaximumHeight(150)
         self.console.setStyleSheet("background-color: #212121; color: #ffffff;")
         
@@ -679,6 +1094,10 @@ class PythonFocusedEditorUI(QMainWindow):
         file_menu.addAction(self.new_action)
         file_menu.addAction(self.open_action)
         self.recent_files_menu = QMenu("Recent Files", self)
+        # The menu is only (re)built when it is about to be shown and the list changed.
+        self._recent_files: List[str] = []
+        self._recent_files_dirty = False
+        self.recent_files_menu.aboutToShow.connect(self._populate_recent_files_menu)
         file_menu.addMenu(self.recent_files_menu)
         file_menu.addSeparator()
         file_menu.addAction(self.save_action)
@@ -725,43 +1144,69 @@ class PythonFocusedEditorUI(QMainWindow):
     def new_tab(self, title: str = "Untitled") -> PyEdit:
         """Adds a new tab to the QTabWidget."""
         editor = PyEdit()
+        editor.setFont(self._editor_font)
         self.tabs.addTab(editor, title)
         self.tabs.setCurrentWidget(editor)
         return editor
 
     def close_tab_dialog(self) -> int:
         """Shows a message box to confirm closing a modified tab."""
-        box = QMessageBox()
-        box.setIcon(QMessageBox.Icon.Warning)
-        box.setWindowTitle("Unsaved Changes")
-        box.setText("Do you want to save your changes?")
-        box.setStandardButtons(QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard | QMessageBox.StandardButton.Cancel)
-        box.setDefaultButton(QMessageBox.StandardButton.Save)
-        return box.exec()
+        if self._close_box is None:
+            box = QMessageBox(self)
+            box.setIcon(QMessageBox.Icon.Warning)
+            box.setWindowTitle("Unsaved Changes")
+            box.setText("Do you want to save your changes?")
+            box.setStandardButtons(QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard | QMessageBox.StandardButton.Cancel)
+            self._close_box = box
+        # Set on every show, so a previous answer never becomes the default.
+        self._close_box.setDefaultButton(QMessageBox.StandardButton.Save)
+        return self._close_box.exec()
 
     def update_tab_title(self, index: int, title: str):
-        """Updates the title of a tab."""
-        self.tabs.setTabText(index, title)
+        """Updates the title of a tab, adding an asterisk if its editor has unsaved changes."""
+        editor = self.tabs.widget(index)
+        editor.tab_has_asterisk = editor.document().isModified()
+        self.tabs.setTabText(index, title + '*' if editor.tab_has_asterisk else title)
+
+    def update_tab_modified(self, index: int):
+        """Adds or removes a tab's asterisk. The tab bar is only touched if that actually changes."""
+        editor = self.tabs.widget(index)
+        if editor.tab_has_asterisk != editor.document().isModified():
+            self.update_tab_title(index, self.tabs.tabText(index).removesuffix('*'))
 
     def set_font_size(self, size: int):
         """Sets the font size for all PyEdit widgets."""
-        font = QFont("Consolas")
-        font.setPointSize(size)
-        self.console.setFont(font)
+        if self._editor_font.pointSize() == size:
+            return
+        self._editor_font.setPointSize(size)
+        self.console.setFont(self._editor_font)
+        # Walk the open tabs only: closed editors are removed from the tab widget but
+        # stay its (hidden) descendants, so findChildren would refont them as well.
         for i in range(self.tabs.count()):
-            editor = self.tabs.widget(i)
-            if isinstance(editor, PyEdit):
-                editor.setFont(font)
+            self.tabs.widget(i).setFont(self._editor_font)
 
     def update_recent_files_menu(self, recent_files: List[str]):
-        """Populates the recent files menu."""
-        self.recent_files_menu.clear()
-        for file_path in recent_files:
-            action = QAction(os.path.basename(file_path), self)
-            action.triggered.connect(lambda checked, path=file_path: self._open_file_from_recent(path))
-            self.recent_files_menu.addAction(action)
+        """Stores the recent files list; the menu itself is rebuilt lazily."""
+        if recent_files != self._recent_files:
+            self._recent_files = list(recent_files)
+            self._recent_files_dirty = True
+
+    def _populate_recent_files_menu(self):
+        """Rebuilds the recent files menu right before it is shown, if the list changed."""
+        if not self._recent_files_dirty:
+            return
+        self._recent_files_dirty = False
 
-    def _open_file_from_recent(self, file_path: str):
+        # QMenu.clear() deletes the actions the menu owns, so they are created on it.
+        self.recent_files_menu.clear()
+        for file_path in self._recent_files:
+            # Files are checked here rather than at startup; missing ones are left out.
+            if not QFileInfo(file_path).exists():
+                continue
+            action = self.recent_files_menu.addAction(os.path.basename(file_path))
+            action.triggered.connect(partial(self._open_file_from_recent, file_path))
+
+    def _open_file_from_recent(self, file_path: str, checked: bool = False):
         """
         A helper method for the recent files menu actions.
         This is a workaround to pass data with QAction.triggered signal.
@@ -787,6 +1232,25 @@ class PythonFocusedEditorController(QObject):
     Main controller class that orchestrates the application logic.
     It connects UI signals to back-end logic (file, process, settings managers).
     """
+    # Emitted from a worker thread with {path: (exists, text)} for the restored tabs
+    _restored_paths_checked = pyqtSignal(dict)
+    # Up to this many restored paths are checked inline; more go to the thread pool.
+    SYNC_STAT_LIMIT = 3
+
+    # Window style sheets. The light theme is Qt's default style.
+    # They're set on the main window itself, since the menu bar and status bar are styled too.
+    _DARK_QSS = """
+        QWidget { background-color: #1e1e1e; color: #d4d4d4; }
+        QPlainTextEdit { background-color: #1e1e1e; color: #d4d4d4; }
+        QLineEdit { background-color: #252526; color: #d4d4d4; }
+        QMenuBar { background-color: #252526; color: #d4d4d4; }
+        QMenuBar::item:selected { background-color: #3f3f40; }
+        QMenu { background-color: #252526; color: #d4d4d4; }
+        QMenu::item:selected { background-color: #3f3f40; }
+        QStatusBar { background-color: #007acc; color: #ffffff; }
+    """
+    _LIGHT_QSS = ""
+
     def __init__(self, ui: PythonFocusedEditorUI):
         super().__init__()
         self.ui = ui
@@ -803,6 +1267,24 @@ class PythonFocusedEditorController(QObject):
         # Pass the file manager instance to the UI for recent file actions
         self.ui.file_manager_instance = self.file_manager
 
+        # Status bar updates are coalesced: bursts of cursor/modification signals
+        # while typing collapse into a single refresh.
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(30)
+        self._status_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._status_timer.timeout.connect(self._do_update_status_bar)
+        self._last_cursor: Optional[tuple] = None
+        self._last_status: Optional[tuple] = None
+
+        # Script output is buffered and written to the console at most once per
+        # frame, instead of one insert (and relayout) per chunk.
+        self._console_buffer: deque[str] = deque()
+        self._console_flush_timer = QTimer(self)
+        self._console_flush_timer.setSingleShot(True)
+        self._console_flush_timer.setInterval(16)
+        self._console_flush_timer.timeout.connect(self._flush_console)
+
         self._connect_signals()
         self._load_initial_settings()
 
@@ -817,7 +1299,7 @@ class PythonFocusedEditorController(QObject):
 
         # File Menu Actions
         self.ui.new_action.triggered.connect(self._handle_file_new)
-        self.ui.open_action.triggered.connect(lambda: self.file_manager.open_file())
+        self.ui.open_action.triggered.connect(self._on_open_action)
         self.ui.save_action.triggered.connect(self._handle_file_save)
         self.ui.save_as_action.triggered.connect(self._handle_file_save_as)
         self.ui.close_all_action.triggered.connect(self._handle_close_all_tabs)
@@ -840,11 +1322,13 @@ class PythonFocusedEditorController(QObject):
         self.file_manager.file_opened_signal.connect(self._on_file_opened)
         self.file_manager.file_saved_signal.connect(self._on_file_saved)
         self.file_manager.file_saved_as_signal.connect(self._on_file_saved_as)
-        self.file_manager.status_message_signal.connect(self.ui.statusBar.showMessage)
+        self.file_manager.status_message_signal.connect(self._show_status_message)
+
+        self._restored_paths_checked.connect(self._on_restored_paths_checked, Qt.ConnectionType.QueuedConnection)
 
         # Script Runner Signals to Controller Methods
-        self.script_runner.output_signal.connect(self.ui.console.appendPlainText)
-        self.script_runner.error_signal.connect(self.ui.console.appendPlainText)
+        self.script_runner.output_signal.connect(self._enqueue_console)
+        self.script_runner.error_signal.connect(self._enqueue_console)
         self.script_runner.finished_signal.connect(self._on_script_finished)
 
     def _load_initial_settings(self):
@@ -855,7 +1339,6 @@ class PythonFocusedEditorController(QObject):
         self.dark_mode = settings_data["dark_mode"]
 
         self.ui.set_font_size(self.font_size)
-        self.recent_files = [f for f in self.recent_files if QFileInfo(f).exists()]
         self.ui.update_recent_files_menu(self.recent_files)
         
         # Apply theme
@@ -864,34 +1347,43 @@ class PythonFocusedEditorController(QObject):
         
         # Load saved tabs and handle non-existent files gracefully
         saved_tabs = settings_data["tabs"]
-        if saved_tabs:
-            # Clear the initial untitled tab if there are saved tabs
-            if self.ui.tabs.count() > 0:
-                self.ui.tabs.removeTab(0)
-            for tab_data in saved_tabs:
-                file_path = tab_data.get("path")
-                content = tab_data.get("content", "")
-                is_dirty = tab_data.get("is_dirty", False)
-
-                editor = self.ui.new_tab("Untitled")
-                editor.setPlainText(content)
-                editor.document().setModified(is_dirty)
-
-                if file_path and QFileInfo(file_path).exists():
-                    editor.file_path = file_path
-                    self.ui.update_tab_title(self.ui.tabs.count() - 1, os.path.basename(file_path))
-                else:
-                    editor.file_path = None
+        if saved_tabs["paths"]:
+            # Restore all tabs in one batch: no repaints and no tab-change signals until
+            # the loop is done. Whether the files still exist is checked afterwards.
+            restored_paths = []
+            read_paths = set()
+            self.ui.setUpdatesEnabled(False)
+            self.ui.tabs.blockSignals(True)
+            try:
+                # Clear the initial untitled tab if there are saved tabs
+                if self.ui.tabs.count() > 0:
+                    self.ui.tabs.removeTab(0)
+                for file_path, content, is_dirty in zip(
+                    saved_tabs["paths"], saved_tabs["contents"], saved_tabs["dirty"]
+                ):
+                    editor = self.ui.new_tab(os.path.basename(file_path) if file_path else "Untitled")
+                    if content is not None:
+                        editor.load_text(content)
+                    elif file_path:
+                        # Clean tab saved without its content: read it back from disk.
+                        # The tab stays read-only, empty and unsaveable until the text arrives.
+                        editor.setReadOnly(True)
+                        editor.awaiting_text = True
+                        read_paths.add(file_path)
+                    editor.document().setModified(is_dirty)
+                    editor.file_path = file_path or None
+                    self.ui.update_tab_modified(self.ui.tabs.count() - 1)
                     if file_path:
-                        QMessageBox.warning(self.ui, "File Not Found", f"Could not open file: {file_path}. It may have been moved or deleted.")
-                
-                # Connect the modification signal for each editor
-                editor.modification_state_changed.connect(
-                    lambda: self._update_status_bar()
-                )
-                editor.cursorPositionChanged.connect(
-                    lambda: self._update_status_bar()
-                )
+                        restored_paths.append(file_path)
+                    
+                    # Connect the modification signal for each editor only after its
+                    # text is in place, so restoring doesn't fire status bar updates.
+                    self._connect_editor(editor)
+            finally:
+                self.ui.tabs.blockSignals(False)
+                self.ui.setUpdatesEnabled(True)
+
+            self._check_restored_paths(restored_paths, read_paths)
 
         if self.ui.tabs.count() == 0:
             self._handle_file_new()
@@ -899,50 +1391,116 @@ class PythonFocusedEditorController(QObject):
         # Set initial window title and status bar message
         self._update_status_bar()
 
+    def _check_restored_paths(self, paths: List[str], read_paths: Set[str]):
+        """
+        Verifies that the restored tabs' files still exist and reads back the ones
+        in read_paths. A few paths are handled inline; larger sessions go to the
+        thread pool so the window can be shown meanwhile.
+        """
+        if len(paths) <= self.SYNC_STAT_LIMIT:
+            self._on_restored_paths_checked(_stat_paths(paths, read_paths))
+        else:
+            QThreadPool.globalInstance().start(_StatTask(paths, read_paths, self._restored_paths_checked))
+
+    def _on_restored_paths_checked(self, results: Dict[str, Tuple[bool, Optional[str]]]):
+        """
+        Fills in restored tabs whose text was read from disk, and detaches
+        restored tabs whose file has gone missing and warns about them.
+        """
+        missing_files = []
+        for i in range(self.ui.tabs.count()):
+            editor = self.ui.tabs.widget(i)
+            if not editor.file_path or editor.file_path not in results:
+                continue
+            exists, text = results[editor.file_path]
+            if editor.awaiting_text:
+                editor.awaiting_text = False
+                editor.setReadOnly(False)
+                if text is not None:
+                    editor.load_text(text)
+                    editor.document().setModified(False)
+            if not exists:
+                missing_files.append(editor.file_path)
+                editor.file_path = None
+                self.ui.update_tab_title(i, "Untitled")
+
+        if missing_files:
+            self._last_status = None
+            self._update_status_bar()
+        for file_path in missing_files:
+            QMessageBox.warning(self.ui, "File Not Found", f"Could not open file: {file_path}. It may have been moved or deleted.")
+
+    def _connect_editor(self, editor: PyEdit):
+        """
+        Connects an editor's signals to the status bar slots.
+        Bound methods only, no lambdas, so the connections go away with the editor.
+        """
+        editor.modification_state_changed.connect(self._update_modified_state)
+        editor.cursorPositionChanged.connect(self._update_status_bar)
+
     def _update_status_bar(self):
+        """
+        Schedules a status bar refresh.
+        This method is now the central point for status bar updates; calls made
+        while a refresh is already pending are merged into it.
+        """
+        # Not restarted while pending, so steady typing still refreshes every 30 ms.
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _update_modified_state(self, modified: bool):
+        """
+        Slot for an editor's modification_state_changed, which fires on real transitions only.
+        This is the one place a tab's asterisk is added or removed.
+        """
+        self.ui.update_tab_modified(self.ui.tabs.indexOf(self.sender()))
+        self._update_status_bar()
+
+    def _show_status_message(self, message: str):
+        """
+        Shows a one-off message in the status bar.
+        A refresh still pending from before the message is run first, so it
+        doesn't overwrite the message when its timer fires.
+        """
+        if self._status_timer.isActive():
+            self._status_timer.stop()
+            self._do_update_status_bar()
+        self.ui.statusBar.showMessage(message)
+
+    def _do_update_status_bar(self):
         """
         Updates the status bar with current line, column, file type, and modification status.
-        This method is now the central point for status bar updates.
+        The cursor label and the rest are each left alone if unchanged since the last refresh.
         """
         editor = self.ui.get_current_editor()
         if not editor:
-            self.ui.statusBar.showMessage("No file open")
-            self.ui.status_cursor_label.setText("")
-            self.ui.status_filetype_label.setText("")
+            if self._last_status is not None:
+                self._last_cursor = self._last_status = None
+                self.ui.statusBar.showMessage("No file open")
+                self.ui.status_cursor_label.setText("")
+                self.ui.status_filetype_label.setText("")
             return
 
         # 1. Update line and column number
         cursor = editor.textCursor()
         line = cursor.blockNumber() + 1
         col = cursor.columnNumber() + 1
-        self.ui.status_cursor_label.setText(f"Ln {line}, Col {col}")
+        if (line, col) != self._last_cursor:
+            self._last_cursor = (line, col)
+            self.ui.status_cursor_label.setText(f"Ln {line}, Col {col}")
 
-        # 2. Update file type and path
         file_path = editor.file_path
-        if file_path:
-            file_info = QFileInfo(file_path)
-            file_extension = file_info.suffix().lower()
-            if file_extension == 'py':
-                self.ui.status_filetype_label.setText("Python")
-            else:
-                self.ui.status_filetype_label.setText(f".{file_extension}")
-        else:
-            self.ui.status_filetype_label.setText("Plain Text")
+        is_modified = editor.document().isModified()
+        status = (editor, file_path, is_modified)
+        if status == self._last_status:
+            return
+        self._last_status = status
+
+        # 2. Update file type and path
+        self.ui.status_filetype_label.setText(editor.filetype_label)
 
         # 3. Update modification status in the main message area
-        status_message = ""
-        if editor.document().isModified():
-            status_message = "Unsaved changes"
-            # We also update the tab title with an asterisk
-            current_title = self.ui.tabs.tabText(self.ui.tabs.currentIndex())
-            if not current_title.endswith('*'):
-                self.ui.tabs.setTabText(self.ui.tabs.currentIndex(), current_title + '*')
-        else:
-            status_message = "Ready"
-            # Remove the asterisk from the tab title
-            current_title = self.ui.tabs.tabText(self.ui.tabs.currentIndex())
-            if current_title.endswith('*'):
-                self.ui.tabs.setTabText(self.ui.tabs.currentIndex(), current_title.removesuffix('*'))
+        status_message = "Unsaved changes" if is_modified else "Ready"
             
         # Display the file path or "New file" as the main status message
         if file_path:
@@ -994,6 +1552,10 @@ class PythonFocusedEditorController(QObject):
         """Updates status bar and window title when the active tab changes."""
         self._update_status_bar()
 
+    def _on_open_action(self):
+        """Slot for the Open action; shows the open dialog rather than passing `checked` as a path."""
+        self.file_manager.open_file()
+
     def _handle_file_new(self):
         """Creates a new, untitled tab with a unique name."""
         title = f"Untitled {self.untitled_counter}"
@@ -1001,8 +1563,7 @@ class PythonFocusedEditorController(QObject):
         new_editor = self.ui.new_tab(title)
         
         # Connect the signals for the new editor to update the status bar
-        new_editor.modification_state_changed.connect(self._update_status_bar)
-        new_editor.cursorPositionChanged.connect(self._update_status_bar)
+        self._connect_editor(new_editor)
         
         self._update_status_bar()
 
@@ -1026,18 +1587,18 @@ class PythonFocusedEditorController(QObject):
             editor = self.ui.tabs.widget(i)
             if editor.file_path == file_path:
                 self.ui.tabs.setCurrentIndex(i)
-                self.ui.statusBar.showMessage(f"Switched to already open file: {file_path}")
+                self._show_status_message(f"Switched to already open file: {file_path}")
                 return
         
         # If not open, open a new tab
         editor = self.ui.new_tab(title)
-        editor.setPlainText(content)
+        # setPlainText leaves the document unmodified. The modificationChanged pair it
+        # emits comes before the editor is connected, so the status bar never sees it.
+        editor.load_text(content)
         editor.file_path = file_path
-        editor.document().setModified(False)
         
         # Connect signals for this new editor
-        editor.modification_state_changed.connect(self._update_status_bar)
-        editor.cursorPositionChanged.connect(self._update_status_bar)
+        self._connect_editor(editor)
 
         self._add_to_recent_files(file_path)
         self._update_status_bar()
@@ -1046,13 +1607,18 @@ class PythonFocusedEditorController(QObject):
         """Slot for the file_saved_signal."""
         self._update_status_bar()
 
-    def _on_file_saved_as(self, file_path: str, title: str):
-        """Slot for the file_saved_as_signal."""
-        editor = self.ui.get_current_editor()
-        if editor:
-            editor.file_path = file_path
-            self._add_to_recent_files(file_path)
-            self._update_status_bar()
+    def _on_file_saved_as(self, editor: PyEdit, file_path: str, title: str):
+        """
+        Slot for the file_saved_as_signal.
+        The saved editor comes with the signal: closing a background tab can save it
+        while another tab is current.
+        """
+        editor.file_path = file_path
+        index = self.ui.tabs.indexOf(editor)
+        if index != -1:
+            self.ui.update_tab_title(index, editor.file_name)
+        self._add_to_recent_files(file_path)
+        self._update_status_bar()
             
     def _add_to_recent_files(self, file_path: str):
         """Adds a file to the recent files list and updates the menu."""
@@ -1066,14 +1632,19 @@ class PythonFocusedEditorController(QObject):
         """Duplicates the current tab's content into a new tab."""
         editor = self.ui.get_current_editor()
         if editor:
-            new_editor = self.ui.new_tab(self.ui.tabs.tabText(self.ui.tabs.currentIndex()))
+            new_editor = self.ui.new_tab(self.ui.tabs.tabText(self.ui.tabs.currentIndex()).removesuffix('*'))
+            # As with opened files, the copy is made before the editor is connected.
             new_editor.setPlainText(editor.toPlainText())
             new_editor.document().setModified(editor.document().isModified())
             new_editor.file_path = editor.file_path
+            if editor.awaiting_text:
+                # The original is still being restored; the copy waits for the same text.
+                new_editor.setReadOnly(True)
+                new_editor.awaiting_text = True
+            self.ui.update_tab_modified(self.ui.tabs.indexOf(new_editor))
             
             # Connect signals for the duplicated editor
-            new_editor.modification_state_changed.connect(self._update_status_bar)
-            new_editor.cursorPositionChanged.connect(self._update_status_bar)
+            self._connect_editor(new_editor)
             
     def _increase_font(self):
         """Increases the editor font size."""
@@ -1089,23 +1660,11 @@ class PythonFocusedEditorController(QObject):
     def _toggle_theme(self):
         """Toggles between dark and light themes."""
         self.dark_mode = not self.dark_mode
-        if self.dark_mode:
-            self._apply_dark_theme()
-        else:
-            self.ui.setStyleSheet("") # Reset to default
+        self.ui.setStyleSheet(self._DARK_QSS if self.dark_mode else self._LIGHT_QSS)
 
     def _apply_dark_theme(self):
         """Applies a dark theme to the entire application."""
-        self.ui.setStyleSheet("""
-            QWidget { background-color: #1e1e1e; color: #d4d4d4; }
-            QPlainTextEdit { background-color: #1e1e1e; color: #d4d4d4; }
-            QLineEdit { background-color: #252526; color: #d4d4d4; }
-            QMenuBar { background-color: #252526; color: #d4d4d4; }
-            QMenuBar::item:selected { background-color: #3f3f40; }
-            QMenu { background-color: #252526; color: #d4d4d4; }
-            QMenu::item:selected { background-color: #3f3f40; }
-            QStatusBar { background-color: #007acc; color: #ffffff; }
-        """)
+        self.ui.setStyleSheet(self._DARK_QSS)
 
     def _handle_go_to_line(self):
         """Prompts for a line number and moves the cursor."""
@@ -1156,55 +1715,95 @@ class PythonFocusedEditorController(QObject):
                 options |= QTextDocument.FindFlag.FindCaseSensitively
             if params["whole_word"]:
                 options |= QTextDocument.FindFlag.FindWholeWords
+            regex = _search_qregex(find_text, params["case_sensitive"])
             
             cursor = editor.textCursor()
 
             if action == "find":
                 # Find the next occurrence from the current cursor position
-                if not editor.find(find_text, options):
+                if not editor.find(regex, options):
                     # If not found, wrap around and start from the beginning
                     cursor.movePosition(QTextCursor.MoveOperation.Start)
                     editor.setTextCursor(cursor)
-                    if not editor.find(find_text, options):
+                    if not editor.find(regex, options):
                         QMessageBox.information(self.ui, "Find Result", f"No occurrences of '{find_text}' found.")
             
             elif action == "replace":
                 # Check if the current selection matches the find text
                 if cursor.hasSelection() and cursor.selectedText() == find_text:
                     cursor.insertText(replace_text)
-                    editor.setTextCursor(cursor) # This is important to update the cursor after insertion
                 
-                # Now find the next occurrence automatically
-                if not editor.find(find_text, options):
+                # Now find the next occurrence automatically. Searching the document
+                # directly leaves the view alone until the editor cursor is set once.
+                next_cursor = editor.document().find(regex, cursor, options)
+                if next_cursor.isNull():
+                    editor.setTextCursor(cursor)
                     QMessageBox.information(self.ui, "Replace Result", "No more occurrences found.")
+                else:
+                    editor.setTextCursor(next_cursor)
                     
             elif action == "replace_all":
-                # For "Replace All", it's more efficient to do a single text-based replacement.
-                # First, ensure the cursor is at the beginning of the document
-                cursor.movePosition(QTextCursor.MoveOperation.Start)
-                editor.setTextCursor(cursor)
-
+                # For "Replace All", it's more efficient to do a single text-based replacement
+                # with one precompiled pattern covering both the case and whole-word options.
+                pattern = _search_pattern(find_text, params["case_sensitive"], params["whole_word"])
                 content = editor.toPlainText()
-                new_content = ""
-                
-                if not params["case_sensitive"]:
-                    # Use a regex for case-insensitive and whole-word replacement
-                    import re
-                    flags = re.IGNORECASE if not params["case_sensitive"] else 0
-                    if params["whole_word"]:
-                        # This regex ensures we only match whole words
-                        pattern = r'\b' + re.escape(find_text) + r'\b'
-                        new_content = re.sub(pattern, replace_text, content, flags=flags)
-                    else:
-                        new_content = content.replace(find_text, replace_text)
-                else:
-                    new_content = content.replace(find_text, replace_text)
-                        
-                editor.setPlainText(new_content)
+                # A function replacement keeps backslashes in replace_text literal.
+                new_content, count = pattern.subn(lambda match: replace_text, content)
+
+                if count == 0:
+                    QMessageBox.information(self.ui, "Replace All", f"No occurrences of '{find_text}' found.")
+                    return
+
+                if new_content != content:
+                    # Swap the text in one edit block instead of setPlainText, which would
+                    # rebuild the document and throw away the undo history.
+                    # The highlighter is reattached once the dialog is done with.
+                    editor.detach_highlighter()
+                    cursor = QTextCursor(editor.document())
+                    cursor.beginEditBlock()
+                    cursor.select(QTextCursor.SelectionType.Document)
+                    cursor.insertText(new_content)
+                    cursor.endEditBlock()
+                    QTimer.singleShot(0, editor.attach_highlighter)
                 QMessageBox.information(self.ui, "Replace All", f"All occurrences of '{find_text}' replaced.")
 
+    def _enqueue_console(self, text: str):
+        """Slot for the script runner's output; the text is written on the next flush."""
+        self._console_buffer.append(text)
+        # Not restarted while pending, so steady output still shows up every 16 ms.
+        if not self._console_flush_timer.isActive():
+            self._console_flush_timer.start()
+
+    def _flush_console(self, drain: bool = False):
+        """
+        Writes buffered script output to the console, at most OUTPUT_CHUNK_SIZE
+        characters per insert. Whatever is left goes on the next tick, so the
+        console still paints between pieces of a large burst; drain writes it all now.
+        """
+        self._console_flush_timer.stop()
+        buffer = self._console_buffer
+        while buffer:
+            pieces = [buffer.popleft()]
+            size = len(pieces[0])
+            while buffer and size + len(buffer[0]) <= ScriptRunner.OUTPUT_CHUNK_SIZE:
+                size += len(buffer[0])
+                pieces.append(buffer.popleft())
+            self.ui.console.appendPlainText("".join(pieces))
+            if not drain:
+                break
+        if buffer:
+            self._console_flush_timer.start()
+
+    def _clear_console(self):
+        """Clears the console and drops any output still buffered from a previous run."""
+        self._console_flush_timer.stop()
+        self._console_buffer.clear()
+        self.ui.console.clear()
+
     def _send_command_to_process(self, command: str):
         """Sends a command to the process's standard input."""
+        # Output that arrived before the command goes above the next prompt.
+        self._flush_console(drain=True)
         self.script_runner.write_to_stdin(command)
         
     def _run_current_script(self):
@@ -1216,7 +1815,7 @@ class PythonFocusedEditorController(QObject):
 
         self.ui.show_console()
         self.ui.console.setReadOnly(True)
-        self.ui.console.clear()
+        self._clear_console()
         self.ui.stop_script_action.setEnabled(True)
         self.script_runner.run_script(editor.file_path)
 
@@ -1229,7 +1828,7 @@ class PythonFocusedEditorController(QObject):
 
         self.ui.show_console()
         self.ui.console.setReadOnly(False)
-        self.ui.console.clear()
+        self._clear_console()
         self.ui.console.setPrompt("(pdb) ")
         self.ui.stop_script_action.setEnabled(True)
         self.script_runner.run_script(editor.file_path, debugger=True)
@@ -1238,27 +1837,27 @@ class PythonFocusedEditorController(QObject):
         """Slot for the finished_signal."""
         self.ui.stop_script_action.setEnabled(False)
         self.ui.console.setReadOnly(True)
-        self.ui.console.appendPlainText(f"\n[Script finished with exit code {exit_code}]")
+        # Queued behind any output still buffered, so it stays the last line.
+        self._enqueue_console(f"\n[Script finished with exit code {exit_code}]")
 
     def save_settings(self):
         """Saves current application settings and open tabs on exit."""
-        saved_tabs = []
+        paths, contents, dirty = [], [], []
         for i in range(self.ui.tabs.count()):
             editor = self.ui.tabs.widget(i)
             # Use getattr for robustness
             file_path = getattr(editor, 'file_path', '')
-            content = editor.toPlainText()
             is_dirty = editor.document().isModified()
+            # A clean tab backed by a file is read back from disk on the next start.
+            content = editor.toPlainText() if is_dirty or not file_path else None
 
             # Only save non-empty tabs or tabs with a file path.
             if file_path or content:
-                file_data = {
-                    "path": file_path,
-                    "content": content,
-                    "is_dirty": is_dirty
-                }
-                saved_tabs.append(file_data)
-        
+                paths.append(file_path)
+                contents.append(content)
+                dirty.append(is_dirty)
+        saved_tabs = {"paths": paths, "contents": contents, "dirty": dirty}
+
         valid_recent_files = [f for f in self.recent_files if QFileInfo(f).exists()]
         
         self.settings_manager.save_settings(
@@ -1283,6 +1882,8 @@ def main() -> None:
         controller = PythonFocusedEditorController(ui)
         
         app.aboutToQuit.connect(controller.save_settings)
+        # Connected after save_settings so the final values are what gets flushed.
+        app.aboutToQuit.connect(controller.settings_manager.flush)
 
         ui.show()
         sys.exit(app.exec())